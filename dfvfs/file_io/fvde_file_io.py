@@ -3,43 +3,169 @@
 
 from __future__ import unicode_literals
 
-import pyfvde
+import os
 
-from dfvfs.file_io import file_object_io
-from dfvfs.lib import fvde
+from dfvfs.file_io import file_io
 from dfvfs.lib import errors
 from dfvfs.resolver import resolver
 
 
-class FVDEFile(file_object_io.FileObjectIO):
-  """File-like object using pyfvde."""
+class FVDEFile(file_io.FileIO):
+  """File-like object using pyfvde.
 
-  def _OpenFileObject(self, path_spec):
+  The FVDE volume is shared with the FVDE file system, which is cached by
+  the resolver context, so that the volume is only opened and unlocked once
+  while it is in use.
+  """
+
+  def __init__(self, resolver_context):
+    """Initializes a file-like object.
+
+    Args:
+      resolver_context (Context): resolver context.
+    """
+    super(FVDEFile, self).__init__(resolver_context)
+    self._current_offset = 0
+    self._file_system = None
+    self._fvde_volume = None
+
+  def _Close(self):
+    """Closes the file-like object."""
+    self._fvde_volume = None
+
+    self._file_system.Close()
+    self._file_system = None
+
+  def _Open(self, path_spec=None, mode='rb'):
     """Opens the file-like object defined by path specification.
 
     Args:
       path_spec (PathSpec): path specification.
-
-    Returns:
-      FileIO: a file-like object.
+      mode (Optional[str]): file access mode.
 
     Raises:
+      AccessError: if the access to open the file was denied.
+      IOError: if the file-like object could not be opened.
+      OSError: if the file-like object could not be opened.
       PathSpecError: if the path specification is incorrect.
+      ValueError: if the path specification is invalid.
     """
+    if not path_spec:
+      raise ValueError('Missing path specification.')
+
     if not path_spec.HasParent():
       raise errors.PathSpecError(
           'Unsupported path specification without parent.')
 
-    resolver.Resolver.key_chain.ExtractCredentialsFromPathSpec(path_spec)
+    self._file_system = resolver.Resolver.OpenFileSystem(
+        path_spec, resolver_context=self._resolver_context)
+    self._fvde_volume = self._file_system.GetFVDEVolume()
+    self._current_offset = 0
+
+  # Note: that the following functions do not follow the style guide
+  # because they are part of the file-like object interface.
+  # pylint: disable=invalid-name
+
+  def read(self, size=None):
+    """Reads a byte string from the file-like object at the current offset.
+
+    The function will read a byte string of the specified size or
+    all of the remaining data if no size was specified.
+
+    Args:
+      size (Optional[int]): number of bytes to read, where None is all
+          remaining data.
+
+    Returns:
+      bytes: data read.
+
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    if not self._is_open:
+      raise IOError('Not opened.')
+
+    if self._current_offset < 0:
+      raise IOError(
+          'Invalid current offset: {0:d} value less than zero.'.format(
+              self._current_offset))
+
+    volume_size = self._fvde_volume.get_size()
+    if size == 0 or self._current_offset >= volume_size:
+      return b''
+
+    if size is None:
+      size = volume_size
+    if self._current_offset + size > volume_size:
+      size = volume_size - self._current_offset
+
+    # The volume is shared, hence the data is read at an explicit offset
+    # instead of relying on the current offset of the volume.
+    data = self._fvde_volume.read_buffer_at_offset(size, self._current_offset)
+
+    self._current_offset += len(data)
+
+    return data
+
+  def seek(self, offset, whence=os.SEEK_SET):
+    """Seeks to an offset within the file-like object.
+
+    Args:
+      offset (int): offset to seek to.
+      whence (Optional(int)): value that indicates whether offset is an absolute
+          or relative position within the file.
+
+    Raises:
+      IOError: if the seek failed.
+      OSError: if the seek failed.
+    """
+    if not self._is_open:
+      raise IOError('Not opened.')
+
+    if whence == os.SEEK_CUR:
+      offset += self._current_offset
+    elif whence == os.SEEK_END:
+      offset += self._fvde_volume.get_size()
+    elif whence != os.SEEK_SET:
+      raise IOError('Unsupported whence.')
+
+    if offset < 0:
+      raise IOError('Invalid offset value less than zero.')
+
+    self._current_offset = offset
+
+  def get_offset(self):
+    """Retrieves the current offset into the file-like object.
+
+    Returns:
+      int: current offset into the file-like object.
+
+    Raises:
+      IOError: if the file-like object has not been opened.
+      OSError: if the file-like object has not been opened.
+    """
+    if not self._is_open:
+      raise IOError('Not opened.')
+
+    return self._current_offset
+
+  def get_size(self):
+    """Retrieves the size of the file-like object.
+
+    Returns:
+      int: size of the file-like object data.
+
+    Raises:
+      IOError: if the file-like object has not been opened.
+      OSError: if the file-like object has not been opened.
+    """
+    if not self._is_open:
+      raise IOError('Not opened.')
 
-    file_object = resolver.Resolver.OpenFileObject(
-        path_spec.parent, resolver_context=self._resolver_context)
-    fvde_volume = pyfvde.volume()
-    fvde.FVDEVolumeOpen(
-        fvde_volume, path_spec, file_object, resolver.Resolver.key_chain)
-    return fvde_volume
+    return self._fvde_volume.get_size()
 
   @property
   def is_locked(self):
     """bool: True if the volume is locked."""
-    return self._file_object.is_locked()
+    return self._fvde_volume.is_locked()
@@ -7,7 +7,6 @@ import os
 
 from dfvfs.file_io import file_io
 from dfvfs.lib import errors
-from dfvfs.lib import sqlite_database
 from dfvfs.resolver import resolver
 
 
@@ -16,6 +15,8 @@ class SQLiteBlobFile(file_io.FileIO):
 
   _OPERATORS = frozenset(['==', '=', 'IS'])
 
+  _VALUE_BY_ROW_IDENTIFIER_QUERY = 'SELECT {1:s} FROM {0:s} WHERE rowid = ?'
+
   def __init__(self, resolver_context):
     """Initializes the file-like object.
 
@@ -24,18 +25,24 @@ class SQLiteBlobFile(file_io.FileIO):
     """
     super(SQLiteBlobFile, self).__init__(resolver_context)
     self._blob = None
+    self._blob_stream = None
     self._current_offset = 0
     self._database_object = None
-    self._number_of_rows = None
+    self._file_system = None
     self._size = 0
     self._table_name = None
 
   def _Close(self):
     """Closes the file-like object."""
-    if self._database_object:
-      self._database_object.Close()
+    if self._blob_stream is not None:
+      self._blob_stream.close()
+
+    self._file_system.Close()
 
     self._blob = None
+    self._blob_stream = None
+    self._database_object = None
+    self._file_system = None
     self._current_offset = 0
     self._size = 0
     self._table_name = None
@@ -87,14 +94,34 @@ class SQLiteBlobFile(file_io.FileIO):
     if self._database_object:
       raise IOError('Database file already set.')
 
-    file_object = resolver.Resolver.OpenFileObject(
-        path_spec.parent, resolver_context=self._resolver_context)
+    # The database is shared with the SQLite blob file system, which is cached
+    # by the resolver context, so that the database is only opened once while
+    # it is in use.
+    file_system = resolver.Resolver.OpenFileSystem(
+        path_spec, resolver_context=self._resolver_context)
 
     try:
-      database_object = sqlite_database.SQLiteDatabaseFile()
-      database_object.Open(file_object)
-    finally:
-      file_object.close()
+      database_object = file_system.GetDatabaseObject()
+    except (IOError, OSError, errors.AccessError, errors.PathSpecError):
+      file_system.Close()
+      raise
+
+    # Incremental blob I/O reads the blob on demand instead of reading it
+    # into memory at once. This requires the rowid of the row. The type of
+    # the value is selected as well, since incremental blob I/O is only used
+    # for BLOB values. For TEXT values it returns the bytes as stored, which
+    # in a UTF-16 database differ from the UTF-8 bytes returned by a query.
+    # Selecting the type also ensures the query references the column, since
+    # selecting only the rowid can result in a query plan that uses
+    # a different row order, such as that of a primary key index, which
+    # changes the meaning of the row index.
+    use_blob_stream = database_object.HasIncrementalBlobSupport(table_name)
+    if use_blob_stream:
+      select_expression = 'rowid, TYPEOF({0:s})'.format(column_name)
+      number_of_columns = 2
+    else:
+      select_expression = column_name
+      number_of_columns = 1
 
     # Sanity check the table and column names.
     error_string = ''
@@ -107,7 +134,7 @@ class SQLiteBlobFile(file_io.FileIO):
 
     elif not row_condition:
       query = 'SELECT {0:s} FROM {1:s} LIMIT 1 OFFSET {2:d}'.format(
-          column_name, table_name, row_index)
+          select_expression, table_name, row_index)
       rows = database_object.Query(query)
 
     elif not database_object.HasColumn(table_name, row_condition[0]):
@@ -122,12 +149,13 @@ class SQLiteBlobFile(file_io.FileIO):
 
     else:
       query = 'SELECT {0:s} FROM {1:s} WHERE {2:s} {3:s} ?'.format(
-          column_name, table_name, row_condition[0], row_condition[1])
+          select_expression, table_name, row_condition[0], row_condition[1])
       rows = database_object.Query(query, parameters=(row_condition[2], ))
 
     # Make sure the query returns a single row, using cursor.rowcount
     # is not reliable for this purpose.
-    if not error_string and (len(rows) != 1 or len(rows[0]) != 1):
+    if not error_string and (
+        len(rows) != 1 or len(rows[0]) != number_of_columns):
       if not row_condition:
         error_string = (
             'Unable to open blob in table: {0:s} and column: {1:s} '
@@ -142,13 +170,34 @@ class SQLiteBlobFile(file_io.FileIO):
                 table_name, column_name, row_condition_string)
 
     if error_string:
-      database_object.Close()
+      file_system.Close()
       raise IOError(error_string)
 
-    self._blob = rows[0][0]
+    if use_blob_stream:
+      row_identifier, value_type = rows[0]
+
+      if value_type == b'blob':
+        try:
+          self._blob_stream = database_object.OpenBlob(
+              table_name, column_name, row_identifier)
+        except IOError:
+          file_system.Close()
+          raise
+
+        self._size = len(self._blob_stream)
+
+      else:
+        query = self._VALUE_BY_ROW_IDENTIFIER_QUERY.format(
+            table_name, column_name)
+        rows = database_object.Query(query, parameters=(row_identifier, ))
+
+    if self._blob_stream is None:
+      self._blob = rows[0][0]
+      self._size = len(self._blob)
+
     self._current_offset = 0
     self._database_object = database_object
-    self._size = len(self._blob)
+    self._file_system = file_system
     self._table_name = table_name
 
   # TODO: remove this when there is a move this to a central temp file
@@ -166,11 +215,7 @@ class SQLiteBlobFile(file_io.FileIO):
     if not self._database_object:
       raise IOError('Not opened.')
 
-    if self._number_of_rows is None:
-      self._number_of_rows = self._database_object.GetNumberOfRows(
-          self._table_name)
-
-    return self._number_of_rows
+    return self._file_system.GetNumberOfRows(self._table_name)
 
   # Note: that the following functions do not follow the style guide
   # because they are part of the file-like object interface.
@@ -209,6 +254,11 @@ class SQLiteBlobFile(file_io.FileIO):
 
     start_offset = self._current_offset
     self._current_offset += size
+
+    if self._blob_stream is not None:
+      self._blob_stream.seek(start_offset, os.SEEK_SET)
+      return self._blob_stream.read(size)
+
     return self._blob[start_offset:self._current_offset]
 
   def seek(self, offset, whence=os.SEEK_SET):
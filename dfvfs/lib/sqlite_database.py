@@ -4,6 +4,7 @@
 from __future__ import unicode_literals
 
 import os
+import shutil
 import sqlite3
 import tempfile
 
@@ -11,17 +12,29 @@ import tempfile
 class SQLiteDatabaseFile(object):
   """SQLite database file using a file-like object."""
 
-  _COPY_BUFFER_SIZE = 65536
+  _COPY_BUFFER_SIZE = 4 * 1024 * 1024
 
   _HAS_COLUMN_QUERY = 'PRAGMA table_info("{0:s}")'
 
   _HAS_TABLE_QUERY = (
       'SELECT name FROM sqlite_master WHERE type = "table"')
 
+  _HAS_ROW_IDENTIFIERS_QUERY = 'SELECT rowid FROM {0:s} LIMIT 0'
+
   _HEADER_SIGNATURE = b'SQLite format 3'
 
   _NUMBER_OF_ROWS_QUERY = 'SELECT COUNT(*) FROM {0:s}'
 
+  _QUERY_BATCH_SIZE = 1024
+
+  # Pragmas applied to the temporary copy of the database. The copy is only
+  # read, hence settings that affect writing, such as the journal mode and
+  # page size, are left unchanged.
+  _PRAGMAS = [
+      'PRAGMA cache_size = -65536',
+      'PRAGMA mmap_size = 268435456',
+      'PRAGMA temp_store = MEMORY']
+
   def __init__(self):
     """Initializes the database file object."""
     super(SQLiteDatabaseFile, self).__init__()
@@ -31,6 +44,15 @@ class SQLiteDatabaseFile(object):
     self._table_names = None
     self._temp_file_path = ''
 
+  def _OpenTemporaryCopy(self):
+    """Opens the temporary copy of the database."""
+    self._connection = sqlite3.connect(self._temp_file_path)
+    self._connection.text_factory = bytes
+    self._cursor = self._connection.cursor()
+
+    for pragma in self._PRAGMAS:
+      self._cursor.execute(pragma)
+
   def Close(self):
     """Closes the database file object.
 
@@ -127,6 +149,39 @@ class SQLiteDatabaseFile(object):
     column_name = column_name.lower()
     return column_name in column_names
 
+  def HasIncrementalBlobSupport(self, table_name):
+    """Determines if blobs in a specific table can be read incrementally.
+
+    Incremental blob I/O requires sqlite3.Connection.blobopen, which was
+    added in Python 3.11, and a table with row identifiers, in other words
+    not a WITHOUT ROWID table.
+
+    Args:
+      table_name (str): name of the table.
+
+    Returns:
+      bool: True if blobs in the table can be read incrementally.
+
+    Raises:
+      IOError: if the database file is not opened.
+      OSError: if the database file is not opened.
+    """
+    if not self._connection:
+      raise IOError('Not opened.')
+
+    if not hasattr(self._connection, 'blobopen'):
+      return False
+
+    if not self.HasTable(table_name):
+      return False
+
+    try:
+      self._cursor.execute(self._HAS_ROW_IDENTIFIERS_QUERY.format(table_name))
+    except sqlite3.OperationalError:
+      return False
+
+    return True
+
   def HasTable(self, table_name):
     """Determines if a specific table exists.
 
@@ -194,9 +249,72 @@ class SQLiteDatabaseFile(object):
         temp_file.write(data)
         data = file_object.read(self._COPY_BUFFER_SIZE)
 
-    self._connection = sqlite3.connect(self._temp_file_path)
-    self._connection.text_factory = bytes
-    self._cursor = self._connection.cursor()
+    self._OpenTemporaryCopy()
+
+  def OpenPath(self, path):
+    """Opens the database file stored in a file of the operating system.
+
+    As with Open a temporary copy of the database is made, since opening
+    the database directly can change it or its journal files and holds
+    locks on it. The copy is made by the operating system, which does not
+    require reading the database into memory. Only the database file is
+    copied, hence changes in a journal or write-ahead log (WAL) file are
+    ignored, as they are by Open.
+
+    Args:
+      path (str): path of the database file.
+
+    Raises:
+      IOError: if the SQLite database signature does not match or
+          the database could not be copied.
+      OSError: if the SQLite database signature does not match or
+          the database could not be copied.
+      ValueError: if the path is invalid.
+    """
+    if not path:
+      raise ValueError('Missing path.')
+
+    with open(path, 'rb') as file_object:
+      data = file_object.read(len(self._HEADER_SIGNATURE))
+
+    if data != self._HEADER_SIGNATURE:
+      raise IOError('Unsupported SQLite database signature.')
+
+    with tempfile.NamedTemporaryFile(delete=False) as temp_file:
+      self._temp_file_path = temp_file.name
+
+    shutil.copyfile(path, self._temp_file_path)
+
+    self._OpenTemporaryCopy()
+
+  def OpenBlob(self, table_name, column_name, row_identifier):
+    """Opens a blob for incremental reading.
+
+    Args:
+      table_name (str): name of the table.
+      column_name (str): name of the column.
+      row_identifier (int): identifier (rowid) of the row.
+
+    Returns:
+      sqlite3.Blob: read-only blob.
+
+    Raises:
+      IOError: if the database file is not opened or the blob could not
+          be opened.
+      OSError: if the database file is not opened or the blob could not
+          be opened.
+    """
+    if not self._connection:
+      raise IOError('Not opened.')
+
+    try:
+      return self._connection.blobopen(
+          table_name, column_name, row_identifier, readonly=True)
+    except sqlite3.Error as exception:
+      raise IOError((
+          'Unable to open blob in table: {0:s} and column: {1:s} for row '
+          'identifier: {2:d} with error: {3!s}').format(
+              table_name, column_name, row_identifier, exception))
 
   def Query(self, query, parameters=None):
     """Queries the database file.
@@ -217,3 +335,29 @@ class SQLiteDatabaseFile(object):
       self._cursor.execute(query)
 
     return self._cursor.fetchall()
+
+  def QueryInBatches(self, query, parameters=None):
+    """Queries the database file and retrieves the rows in batches.
+
+    This limits the number of rows that are kept in memory at once for
+    queries that return a large number of rows. Note that no other queries
+    should be run until all batches have been retrieved.
+
+    Args:
+      query (str): SQL query.
+      parameters (Optional[dict|tuple]): query parameters.
+
+    Yields:
+      list[sqlite3.Row]: batch of rows resulting from the query.
+    """
+    # Note that we cannot pass parameters as a keyword argument here.
+    # A parameters value of None is not supported.
+    if parameters:
+      self._cursor.execute(query, parameters)
+    else:
+      self._cursor.execute(query)
+
+    rows = self._cursor.fetchmany(self._QUERY_BATCH_SIZE)
+    while rows:
+      yield rows
+      rows = self._cursor.fetchmany(self._QUERY_BATCH_SIZE)
@@ -25,16 +25,44 @@ class FakePathSpec(location_path_spec.LocationPathSpec):
     Raises:
       ValueError: when parent is set.
     """
-    parent = None
-    if 'parent' in kwargs:
-      parent = kwargs['parent']
-      del kwargs['parent']
-
-    if parent:
+    if kwargs.pop('parent', None):
       raise ValueError('Parent value set.')
 
-    super(FakePathSpec, self).__init__(
-        location=location, parent=parent, **kwargs)
+    super(FakePathSpec, self).__init__(location=location, **kwargs)
+
+  def __hash__(self):
+    """Returns the hash of a path specification."""
+    # Since the fake path specification cannot have a parent the comparable
+    # is determined by the location only, hence the comparable string does
+    # not need to be built.
+    return hash((self.TYPE_INDICATOR, self.location))
+
+  @classmethod
+  def NewFromLocation(cls, location):
+    """Creates a path specification from a location.
+
+    This is a faster alternative to the constructor, which the fake file
+    system uses to create path specifications while enumerating its file
+    entries. Since the fake path specification cannot have a parent and has
+    no other attributes, the keyword argument handling of the constructor
+    is not needed.
+
+    Args:
+      location (str): location e.g. /opt/dfvfs.
+
+    Returns:
+      FakePathSpec: path specification.
+
+    Raises:
+      ValueError: when location is not set.
+    """
+    if not location:
+      raise ValueError('Missing location value.')
+
+    path_spec = cls.__new__(cls)
+    path_spec.parent = None
+    path_spec.location = location
+    return path_spec
 
 
 factory.Factory.RegisterPathSpec(FakePathSpec)
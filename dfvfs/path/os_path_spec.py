@@ -31,18 +31,13 @@ class OSPathSpec(location_path_spec.LocationPathSpec):
     if not location:
       raise ValueError('Missing location value.')
 
-    parent = None
-    if 'parent' in kwargs:
-      parent = kwargs['parent']
-      del kwargs['parent']
-
-    if parent:
+    if kwargs.pop('parent', None):
       raise ValueError('Parent value set.')
 
     # Within the path specification the path should be absolute.
     location = os.path.abspath(location)
 
-    super(OSPathSpec, self).__init__(location=location, parent=parent, **kwargs)
+    super(OSPathSpec, self).__init__(location=location, **kwargs)
 
 
 factory.Factory.RegisterPathSpec(OSPathSpec)
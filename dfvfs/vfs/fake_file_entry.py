@@ -41,7 +41,7 @@ class FakeDirectory(file_entry.Directory):
           continue
 
         path_spec_location = self._file_system.JoinPath([path])
-        yield fake_path_spec.FakePathSpec(location=path_spec_location)
+        yield fake_path_spec.FakePathSpec.NewFromLocation(path_spec_location)
 
 
 class FakeFileEntry(file_entry.FileEntry):
@@ -191,5 +191,5 @@ class FakeFileEntry(file_entry.FileEntry):
     if parent_location == '':
       parent_location = self._file_system.PATH_SEPARATOR
 
-    path_spec = fake_path_spec.FakePathSpec(location=parent_location)
+    path_spec = fake_path_spec.FakePathSpec.NewFromLocation(parent_location)
     return self._file_system.GetFileEntryByPathSpec(path_spec)
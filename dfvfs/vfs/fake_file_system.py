@@ -141,7 +141,7 @@ class FakeFileSystem(file_system.FileSystem):
     if not file_entry_type:
       return None
 
-    path_spec = fake_path_spec.FakePathSpec(location=path)
+    path_spec = fake_path_spec.FakePathSpec.NewFromLocation(path)
     is_root = bool(path == self.LOCATION_ROOT)
     return fake_file_entry.FakeFileEntry(
         self._resolver_context, self, path_spec,
@@ -173,5 +173,6 @@ class FakeFileSystem(file_system.FileSystem):
     Returns:
       FakeFileEntry: a file entry or None if not available.
     """
-    path_spec = fake_path_spec.FakePathSpec(location=self.LOCATION_ROOT)
+    path_spec = fake_path_spec.FakePathSpec.NewFromLocation(
+        self.LOCATION_ROOT)
     return self.GetFileEntryByPathSpec(path_spec)
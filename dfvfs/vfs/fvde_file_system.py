@@ -28,6 +28,7 @@ class FVDEFileSystem(root_only_file_system.RootOnlyFileSystem):
     super(FVDEFileSystem, self).__init__(resolver_context)
     self._fvde_volume = None
     self._file_object = None
+    self._root_path_spec = None
 
   def _Close(self):
     """Closes the file system.
@@ -41,6 +42,8 @@ class FVDEFileSystem(root_only_file_system.RootOnlyFileSystem):
     self._file_object.close()
     self._file_object = None
 
+    self._root_path_spec = None
+
   def _Open(self, path_spec, mode='rb'):
     """Opens the file system defined by path specification.
 
@@ -98,8 +101,16 @@ class FVDEFileSystem(root_only_file_system.RootOnlyFileSystem):
   def GetRootFileEntry(self):
     """Retrieves the root file entry.
 
+    The path specification of the root file entry does not change while
+    the file system is open and is therefore only created once. The file
+    entry itself is not cached, since it holds a reference to the file
+    system, which would prevent the file system from being closed.
+
     Returns:
       FVDEFileEntry: file entry or None.
     """
-    path_spec = fvde_path_spec.FVDEPathSpec(parent=self._path_spec.parent)
-    return self.GetFileEntryByPathSpec(path_spec)
+    if self._root_path_spec is None:
+      self._root_path_spec = fvde_path_spec.FVDEPathSpec(
+          parent=self._path_spec.parent)
+
+    return self.GetFileEntryByPathSpec(self._root_path_spec)
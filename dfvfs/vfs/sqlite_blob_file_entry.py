@@ -40,18 +40,13 @@ class SQLiteBlobDirectory(file_entry.Directory):
 
     if table_name and column_name:
       if self._number_of_entries is None:
-        # Open the first entry to determine how many entries we have.
-        # TODO: change this when there is a move this to a central temp file
-        # manager. https://github.com/log2timeline/dfvfs/issues/92
-        path_spec = sqlite_blob_path_spec.SQLiteBlobPathSpec(
-            table_name=table_name, column_name=column_name, row_index=0,
-            parent=self.path_spec.parent)
-
-        sub_file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
-        if not file_entry:
-          self._number_of_entries = 0
-        else:
-          self._number_of_entries = sub_file_entry.GetNumberOfRows()
+        try:
+          self._number_of_entries = self._file_system.GetNumberOfRows(
+              table_name)
+        except (IOError, OSError) as exception:
+          raise errors.BackEndError(
+              'Unable to determine number of rows with error: {0!s}'.format(
+                  exception))
 
       for row_index in range(0, self._number_of_entries):
         yield sqlite_blob_path_spec.SQLiteBlobPathSpec(
@@ -137,12 +132,15 @@ class SQLiteBlobFileEntry(file_entry.FileEntry):
     """int: size of the file entry in bytes or None if not available."""
     size = None
     if not self._is_virtual:
-      file_object = self.GetFileObject()
-      if file_object:
-        try:
-          size = file_object.get_size()
-        finally:
-          file_object.close()
+      size = self._file_system.GetBlobSizeByPathSpec(self.path_spec)
+
+      if size is None:
+        file_object = self.GetFileObject()
+        if file_object:
+          try:
+            size = file_object.get_size()
+          finally:
+            file_object.close()
 
     return size
 
@@ -153,18 +151,15 @@ class SQLiteBlobFileEntry(file_entry.FileEntry):
       int: number of rows.
 
     Raises:
-      BackEndError: when the SQLite blob file-like object is missing.
+      BackEndError: when the number of rows cannot be determined.
     """
-    file_object = self.GetFileObject()
-    if not file_object:
-      raise errors.BackEndError(
-          'Unable to retrieve SQLite blob file-like object.')
-
     try:
-      # TODO: move this function out of SQLiteBlobFile.
-      self._number_of_entries = file_object.GetNumberOfRows()
-    finally:
-      file_object.close()
+      self._number_of_entries = self._file_system.GetNumberOfRows(
+          self.path_spec.table_name)
+    except (IOError, OSError) as exception:
+      raise errors.BackEndError(
+          'Unable to determine number of rows with error: {0!s}'.format(
+              exception))
 
     return self._number_of_entries
 
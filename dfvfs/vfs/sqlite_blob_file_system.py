@@ -3,8 +3,12 @@
 
 from __future__ import unicode_literals
 
+import array
+import os
+
 from dfvfs.lib import definitions
 from dfvfs.lib import errors
+from dfvfs.lib import sqlite_database
 from dfvfs.path import sqlite_blob_path_spec
 from dfvfs.resolver import resolver
 from dfvfs.vfs import sqlite_blob_file_entry
@@ -16,6 +20,19 @@ class SQLiteBlobFileSystem(file_system.FileSystem):
 
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_SQLITE_BLOB
 
+  # LENGTH of a blob is determined without reading its content, hence only
+  # text values, for which LENGTH returns the number of characters, are cast.
+  _BLOB_SIZES_QUERY = (
+      "SELECT CASE WHEN TYPEOF({1:s}) = 'text' "
+      'THEN LENGTH(CAST({1:s} AS BLOB)) ELSE IFNULL(LENGTH({1:s}), 0) END '
+      'FROM {0:s}')
+
+  _OPERATORS = frozenset(['==', '=', 'IS'])
+
+  # The query is limited to 2 rows since a row condition must match
+  # a single row.
+  _ROW_CONDITION_QUERY = 'SELECT 1 FROM {0:s} WHERE {1:s} {2:s} ? LIMIT 2'
+
   def __init__(self, resolver_context):
     """Initializes a file system.
 
@@ -23,8 +40,9 @@ class SQLiteBlobFileSystem(file_system.FileSystem):
       resolver_context (Context): resolver context.
     """
     super(SQLiteBlobFileSystem, self).__init__(resolver_context)
-    self._file_object = None
-    self._number_of_rows = None
+    self._blob_sizes_per_column = {}
+    self._database_object = None
+    self._number_of_rows_per_table = {}
 
   def _Close(self):
     """Closes a file system.
@@ -32,9 +50,44 @@ class SQLiteBlobFileSystem(file_system.FileSystem):
     Raises:
       IOError: if the close failed.
     """
-    self._file_object.close()
-    self._file_object = None
-    self._number_of_rows = None
+    if self._database_object:
+      self._database_object.Close()
+
+    self._database_object = None
+    self._blob_sizes_per_column = {}
+    self._number_of_rows_per_table = {}
+
+  def _GetBlobSizes(self, table_name, column_name):
+    """Retrieves the sizes of the blobs stored in a column.
+
+    The sizes of all rows are retrieved with a single query and cached, to
+    prevent having to open every blob to determine its size or existence.
+
+    Args:
+      table_name (str): name of the table.
+      column_name (str): name of the column.
+
+    Returns:
+      array.array: blob sizes, in row order, or None if the table or column
+          does not exist.
+    """
+    lookup_key = (table_name, column_name)
+    blob_sizes = self._blob_sizes_per_column.get(lookup_key, None)
+    if blob_sizes is None:
+      database_object = self.GetDatabaseObject()
+      if (not database_object.HasTable(table_name) or
+          not database_object.HasColumn(table_name, column_name)):
+        return None
+
+      query = self._BLOB_SIZES_QUERY.format(table_name, column_name)
+
+      blob_sizes = array.array('q')
+      for rows in database_object.QueryInBatches(query):
+        blob_sizes.extend(row[0] for row in rows)
+
+      self._blob_sizes_per_column[lookup_key] = blob_sizes
+
+    return blob_sizes
 
   def _Open(self, path_spec, mode='rb'):
     """Opens the file system object defined by path specification.
@@ -54,11 +107,6 @@ class SQLiteBlobFileSystem(file_system.FileSystem):
       raise errors.PathSpecError(
           'Unsupported path specification without parent.')
 
-    file_object = resolver.Resolver.OpenFileObject(
-        path_spec.parent, resolver_context=self._resolver_context)
-
-    self._file_object = file_object
-
   def FileEntryExistsByPathSpec(self, path_spec):
     """Determines if a file entry for a path specification exists.
 
@@ -68,17 +116,100 @@ class SQLiteBlobFileSystem(file_system.FileSystem):
     Returns:
       bool: True if the file entry exists.
     """
-    # All checks for correct path spec is done in SQLiteBlobFile.
-    # Therefore, attempt to open the path specification and
-    # check if errors occurred.
+    table_name = getattr(path_spec, 'table_name', None)
+    column_name = getattr(path_spec, 'column_name', None)
+    row_condition = getattr(path_spec, 'row_condition', None)
+    row_index = getattr(path_spec, 'row_index', None)
+
     try:
-      file_object = resolver.Resolver.OpenFileObject(
-          path_spec, resolver_context=self._resolver_context)
-    except (IOError, ValueError, errors.AccessError, errors.PathSpecError):
+      database_object = self.GetDatabaseObject()
+    except (IOError, OSError, errors.AccessError, errors.PathSpecError):
+      return False
+
+    if (not database_object.HasTable(table_name) or
+        not database_object.HasColumn(table_name, column_name)):
+      return False
+
+    if row_condition:
+      condition_column_name, operator, value = row_condition
+      if (operator not in self._OPERATORS or
+          not database_object.HasColumn(table_name, condition_column_name)):
+        return False
+
+      query = self._ROW_CONDITION_QUERY.format(
+          table_name, condition_column_name, operator)
+      rows = database_object.Query(query, parameters=(value, ))
+      return len(rows) == 1
+
+    if not isinstance(row_index, int):
       return False
 
-    file_object.close()
-    return True
+    number_of_rows = self.GetNumberOfRows(table_name)
+    return 0 <= row_index < number_of_rows
+
+  def GetBlobSizeByPathSpec(self, path_spec):
+    """Retrieves the size of a blob for a path specification.
+
+    Args:
+      path_spec (PathSpec): path specification.
+
+    Returns:
+      int: size of the blob in bytes or None if not available, for example
+          when the path specification defines a row condition instead of
+          a row index.
+    """
+    row_condition = getattr(path_spec, 'row_condition', None)
+    row_index = getattr(path_spec, 'row_index', None)
+
+    if row_condition or not isinstance(row_index, int):
+      return None
+
+    blob_sizes = self._GetBlobSizes(path_spec.table_name, path_spec.column_name)
+    if blob_sizes is None or not 0 <= row_index < len(blob_sizes):
+      return None
+
+    return blob_sizes[row_index]
+
+  def GetDatabaseObject(self):
+    """Retrieves the database object.
+
+    The database is opened on first use, since opening it can require a copy
+    of the entire database, which is not needed to retrieve file entries.
+    A database stored in a regular file of the operating system is copied
+    by the operating system instead of being read through a file-like
+    object. The database object is shared with the SQLite blob file-like
+    objects that use this file system.
+
+    Returns:
+      SQLiteDatabaseFile: database object.
+
+    Raises:
+      AccessError: if the access to open the database was denied.
+      IOError: if the database could not be opened.
+      OSError: if the database could not be opened.
+      PathSpecError: if the path specification is incorrect.
+    """
+    if self._database_object is None:
+      parent_path_spec = self._path_spec.parent
+      location = getattr(parent_path_spec, 'location', None)
+
+      database_object = sqlite_database.SQLiteDatabaseFile()
+      if (parent_path_spec.type_indicator == definitions.TYPE_INDICATOR_OS and
+          location and os.path.isfile(location)):
+        database_object.OpenPath(location)
+
+      else:
+        file_object = resolver.Resolver.OpenFileObject(
+            parent_path_spec, resolver_context=self._resolver_context)
+
+        try:
+          database_object.Open(file_object)
+        finally:
+          file_object.close()
+
+      self._database_object = database_object
+
+    return self._database_object
 
   def GetFileEntryByPathSpec(self, path_spec):
     """Retrieves a file entry for a path specification.
@@ -93,13 +224,40 @@ class SQLiteBlobFileSystem(file_system.FileSystem):
     row_condition = getattr(path_spec, 'row_condition', None)
 
     # If no row_index or row_condition is provided, return a directory.
-    if row_index is None and row_condition is None:
-      return sqlite_blob_file_entry.SQLiteBlobFileEntry(
-          self._resolver_context, self, path_spec, is_root=True,
-          is_virtual=True)
+    is_directory = row_index is None and row_condition is None
 
     return sqlite_blob_file_entry.SQLiteBlobFileEntry(
-        self._resolver_context, self, path_spec)
+        self._resolver_context, self, path_spec, is_root=is_directory,
+        is_virtual=is_directory)
+
+  def GetNumberOfRows(self, table_name):
+    """Retrieves the number of rows in a table.
+
+    The number of rows is cached per table, since the file system can be
+    shared by path specifications of different tables in the same database.
+
+    Args:
+      table_name (str): name of the table.
+
+    Returns:
+      int: number of rows.
+
+    Raises:
+      IOError: if the database could not be opened or the table does
+          not exist.
+      OSError: if the database could not be opened or the table does
+          not exist.
+    """
+    number_of_rows = self._number_of_rows_per_table.get(table_name, None)
+    if number_of_rows is None:
+      database_object = self.GetDatabaseObject()
+      if not database_object.HasTable(table_name):
+        raise IOError('Missing table: {0:s}'.format(table_name))
+
+      number_of_rows = database_object.GetNumberOfRows(table_name)
+      self._number_of_rows_per_table[table_name] = number_of_rows
+
+    return number_of_rows
 
   def GetRootFileEntry(self):
     """Retrieves the root file entry.
@@ -4,13 +4,19 @@
 
 from __future__ import unicode_literals
 
+import os
+import sqlite3
+import tempfile
 import unittest
 
+from dfvfs.file_io import fake_file_io
 from dfvfs.file_io import sqlite_blob_file_io
+from dfvfs.path import fake_path_spec
 from dfvfs.path import sqlite_blob_path_spec
 from dfvfs.path import os_path_spec
 from dfvfs.resolver import context
 
+from tests import test_lib as shared_test_lib
 from tests.file_io import test_lib
 
 
@@ -97,5 +103,226 @@ class SQLiteBlobFileWithIndexTest(test_lib.SylogTestCase):
     file_object.close()
 
 
+class SQLiteBlobFileWithIndexAndPrimaryKeyTest(shared_test_lib.BaseTestCase):
+  """The unit test for a SQLite blob file-like object using row index.
+
+  The table in the test file has a primary key index, which must not
+  affect the order of the rows.
+  """
+
+  # pylint: disable=protected-access
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._resolver_context = context.Context()
+    test_file = self._GetTestFilePath(['blob.db'])
+    self._SkipIfPathNotExists(test_file)
+
+    path_spec = os_path_spec.OSPathSpec(location=test_file)
+    self._sqlite_blob_path_spec = sqlite_blob_path_spec.SQLiteBlobPathSpec(
+        table_name='myblobs', column_name='blobs', row_index=0,
+        parent=path_spec)
+
+  def testRead(self):
+    """Test the read functionality."""
+    file_object = sqlite_blob_file_io.SQLiteBlobFile(self._resolver_context)
+    file_object.open(path_spec=self._sqlite_blob_path_spec)
+
+    self.assertEqual(file_object.get_size(), 110592)
+
+    file_object.seek(16, os.SEEK_SET)
+    self.assertEqual(file_object.get_offset(), 16)
+
+    data = file_object.read(4)
+    self.assertEqual(data, b'\x10\x00\x01\x01')
+
+    file_object.close()
+
+  def testOpenSharesDatabase(self):
+    """Test that file-like objects of the same database share it."""
+    file_object1 = sqlite_blob_file_io.SQLiteBlobFile(self._resolver_context)
+    file_object1.open(path_spec=self._sqlite_blob_path_spec)
+
+    path_spec = sqlite_blob_path_spec.SQLiteBlobPathSpec(
+        table_name='myblobs', column_name='blobs', row_index=1,
+        parent=self._sqlite_blob_path_spec.parent)
+    file_object2 = sqlite_blob_file_io.SQLiteBlobFile(self._resolver_context)
+    file_object2.open(path_spec=path_spec)
+
+    self.assertIs(
+        file_object1._database_object, file_object2._database_object)
+
+    file_object1.close()
+
+    self.assertEqual(file_object2.get_size(), 11)
+    self.assertEqual(file_object2.GetNumberOfRows(), 4)
+
+    file_object2.close()
+
+
+class SQLiteBlobFileWithCopyTest(shared_test_lib.BaseTestCase):
+  """The unit test for a SQLite blob file-like object of a copied database.
+
+  A database that is not stored in an operating system file is copied to
+  a temporary file before it is opened.
+  """
+
+  # pylint: disable=protected-access
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._resolver_context = context.Context()
+    test_file = self._GetTestFilePath(['blob.db'])
+    self._SkipIfPathNotExists(test_file)
+
+    with open(test_file, 'rb') as file_object:
+      file_data = file_object.read()
+
+    # The fake file-like object is cached by the resolver context, which
+    # allows the SQLite blob file-like object to resolve it as its parent.
+    path_spec = fake_path_spec.FakePathSpec(location='/blob.db')
+    self._parent_file_object = fake_file_io.FakeFile(
+        self._resolver_context, file_data)
+    self._parent_file_object.open(path_spec=path_spec)
+
+    self._sqlite_blob_path_spec = sqlite_blob_path_spec.SQLiteBlobPathSpec(
+        table_name='myblobs', column_name='blobs', row_index=0,
+        parent=path_spec)
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    self._parent_file_object.close()
+
+  def testOpenClosePathSpec(self):
+    """Test the open and close functionality using a path specification."""
+    file_object = sqlite_blob_file_io.SQLiteBlobFile(self._resolver_context)
+    file_object.open(path_spec=self._sqlite_blob_path_spec)
+
+    database_object = file_object._database_object
+    self.assertTrue(os.path.isfile(database_object._temp_file_path))
+
+    rows = database_object.Query('PRAGMA cache_size')
+    self.assertEqual(rows[0][0], -65536)
+
+    rows = database_object.Query('PRAGMA temp_store')
+    self.assertEqual(rows[0][0], 2)
+
+    self.assertEqual(file_object.GetNumberOfRows(), 4)
+
+    file_object.close()
+
+    self.assertEqual(database_object._temp_file_path, '')
+
+  def testRead(self):
+    """Test the read functionality."""
+    file_object = sqlite_blob_file_io.SQLiteBlobFile(self._resolver_context)
+    file_object.open(path_spec=self._sqlite_blob_path_spec)
+
+    self.assertEqual(file_object.get_size(), 110592)
+
+    file_object.seek(16, os.SEEK_SET)
+    data = file_object.read(4)
+    self.assertEqual(data, b'\x10\x00\x01\x01')
+
+    file_object.close()
+
+
+class SQLiteBlobFileWithValueTypesTest(shared_test_lib.BaseTestCase):
+  """The unit test for a SQLite blob file-like object of different types.
+
+  The test database uses UTF-16 to store text, for which the stored bytes
+  differ from the UTF-8 bytes returned by a query.
+  """
+
+  # pylint: disable=protected-access
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._resolver_context = context.Context()
+    self._temp_directory = tempfile.TemporaryDirectory()
+    test_file = os.path.join(self._temp_directory.name, 'utf16.db')
+
+    connection = sqlite3.connect(test_file)
+    connection.execute('PRAGMA encoding = "UTF-16le"')
+    connection.execute('CREATE TABLE blobs (blob)')
+    connection.execute('INSERT INTO blobs VALUES (?)', (b'\x01\x02\x03', ))
+    connection.execute('INSERT INTO blobs VALUES (?)', ('text', ))
+    connection.commit()
+    connection.close()
+
+    self._parent_path_spec = os_path_spec.OSPathSpec(location=test_file)
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    self._temp_directory.cleanup()
+
+  def testReadBlob(self):
+    """Test the read functionality of a BLOB value."""
+    path_spec = sqlite_blob_path_spec.SQLiteBlobPathSpec(
+        table_name='blobs', column_name='blob', row_index=0,
+        parent=self._parent_path_spec)
+
+    file_object = sqlite_blob_file_io.SQLiteBlobFile(self._resolver_context)
+    file_object.open(path_spec=path_spec)
+
+    self.assertIsNotNone(file_object._blob_stream)
+    self.assertEqual(file_object.get_size(), 3)
+    self.assertEqual(file_object.read(), b'\x01\x02\x03')
+
+    file_object.close()
+
+  def testReadText(self):
+    """Test the read functionality of a TEXT value."""
+    path_spec = sqlite_blob_path_spec.SQLiteBlobPathSpec(
+        table_name='blobs', column_name='blob', row_index=1,
+        parent=self._parent_path_spec)
+
+    file_object = sqlite_blob_file_io.SQLiteBlobFile(self._resolver_context)
+    file_object.open(path_spec=path_spec)
+
+    self.assertIsNone(file_object._blob_stream)
+    self.assertEqual(file_object.get_size(), 4)
+    self.assertEqual(file_object.read(), b'text')
+
+    file_object.close()
+
+
+class SQLiteBlobFileWithWriteAheadLogTest(shared_test_lib.BaseTestCase):
+  """The unit test for a SQLite blob file-like object of a WAL database."""
+
+  def testOpenDoesNotChangeDatabase(self):
+    """Test that opening a blob does not change or lock the database."""
+    with tempfile.TemporaryDirectory() as temp_directory:
+      test_file = os.path.join(temp_directory, 'wal.db')
+
+      connection = sqlite3.connect(test_file)
+      connection.execute('PRAGMA journal_mode = WAL')
+      connection.execute('CREATE TABLE blobs (blob BLOB)')
+      connection.execute('INSERT INTO blobs VALUES (?)', (b'\x01\x02', ))
+      connection.commit()
+      connection.close()
+
+      path_spec = os_path_spec.OSPathSpec(location=test_file)
+      path_spec = sqlite_blob_path_spec.SQLiteBlobPathSpec(
+          table_name='blobs', column_name='blob', row_index=0,
+          parent=path_spec)
+
+      resolver_context = context.Context()
+      file_object = sqlite_blob_file_io.SQLiteBlobFile(resolver_context)
+      file_object.open(path_spec=path_spec)
+
+      self.assertEqual(file_object.read(), b'\x01\x02')
+
+      # The database can be written while the blob is open.
+      connection = sqlite3.connect(test_file, timeout=0.5)
+      connection.execute('INSERT INTO blobs VALUES (?)', (b'\x03', ))
+      connection.commit()
+      connection.close()
+
+      file_object.close()
+
+      self.assertEqual(os.listdir(temp_directory), ['wal.db'])
+
+
 if __name__ == '__main__':
   unittest.main()
@@ -38,6 +38,33 @@ class FakePathSpecTest(test_lib.PathSpecTestCase):
 
     self.assertEqual(path_spec.comparable, expected_comparable)
 
+  def testHash(self):
+    """Tests the __hash__ function."""
+    path_spec1 = fake_path_spec.FakePathSpec(location='/test')
+    path_spec2 = fake_path_spec.FakePathSpec(location='/test')
+    path_spec3 = fake_path_spec.FakePathSpec(location='/bogus')
+
+    self.assertEqual(path_spec1, path_spec2)
+    self.assertEqual(hash(path_spec1), hash(path_spec2))
+    self.assertNotEqual(path_spec1, path_spec3)
+
+    path_specs = set([path_spec1, path_spec2, path_spec3])
+    self.assertEqual(len(path_specs), 2)
+
+  def testNewFromLocation(self):
+    """Tests the NewFromLocation function."""
+    path_spec = fake_path_spec.FakePathSpec.NewFromLocation('/test')
+
+    self.assertIsNotNone(path_spec)
+    self.assertIsNone(path_spec.parent)
+    self.assertEqual(path_spec.location, '/test')
+    self.assertEqual(
+        path_spec, fake_path_spec.FakePathSpec(location='/test'))
+    self.assertEqual(path_spec.CopyToDict(), {'location': '/test'})
+
+    with self.assertRaises(ValueError):
+      fake_path_spec.FakePathSpec.NewFromLocation(None)
+
   def testIsSystemLevel(self):
     """Tests the IsSystemLevel function."""
     path_spec = fake_path_spec.FakePathSpec(location='/test')
@@ -84,6 +84,24 @@ class FVDEFileSystemTest(shared_test_lib.BaseTestCase):
 
     file_system.Close()
 
+  def testGetRootFileEntryAndClose(self):
+    """Test that the file system closes after retrieving the root."""
+    file_system = fvde_file_system.FVDEFileSystem(self._resolver_context)
+    self.assertIsNotNone(file_system)
+
+    file_system.Open(self._fvde_path_spec)
+
+    file_entry = file_system.GetRootFileEntry()
+    self.assertIsNotNone(file_entry)
+
+    del file_entry
+
+    file_system.Close()
+
+    self.assertIsNone(file_system.GetFVDEVolume())
+    self.assertIsNone(self._resolver_context.GetFileSystemReferenceCount(
+        self._fvde_path_spec))
+
 
 if __name__ == '__main__':
   unittest.main()
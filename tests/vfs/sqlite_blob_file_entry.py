@@ -134,7 +134,13 @@ class SQLiteBlobFileEntryTest(shared_test_lib.BaseTestCase):
     self.assertIsNotNone(file_entry)
     self.assertEqual(file_entry.size, 110592)
 
-  # TODO: add tests for GetNumberOfRows
+  def testGetNumberOfRows(self):
+    """Tests the GetNumberOfRows function."""
+    file_entry = self._file_system.GetFileEntryByPathSpec(
+        self._sqlite_blob_path_spec_directory)
+
+    self.assertIsNotNone(file_entry)
+    self.assertEqual(file_entry.GetNumberOfRows(), 4)
 
   def testGetFileEntryByPathSpec(self):
     """Test the get a file entry by path specification functionality."""
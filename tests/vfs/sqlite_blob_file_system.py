@@ -6,6 +6,8 @@ from __future__ import unicode_literals
 
 import unittest
 
+from dfvfs.file_io import fake_file_io
+from dfvfs.path import fake_path_spec
 from dfvfs.path import sqlite_blob_path_spec
 from dfvfs.path import os_path_spec
 from dfvfs.resolver import context
@@ -59,6 +61,111 @@ class SQLiteBlobFileSystemTest(shared_test_lib.BaseTestCase):
     self.assertTrue(file_system.FileEntryExistsByPathSpec(
         self._sqlite_blob_path_spec_2))
 
+    path_spec = sqlite_blob_path_spec.SQLiteBlobPathSpec(
+        table_name='myblobs', column_name='blobs', row_index=4,
+        parent=self._sqlite_blob_path_spec.parent)
+    self.assertFalse(file_system.FileEntryExistsByPathSpec(path_spec))
+
+    path_spec = sqlite_blob_path_spec.SQLiteBlobPathSpec(
+        table_name='myblobs', column_name='bogus', row_index=0,
+        parent=self._sqlite_blob_path_spec.parent)
+    self.assertFalse(file_system.FileEntryExistsByPathSpec(path_spec))
+
+    path_spec = sqlite_blob_path_spec.SQLiteBlobPathSpec(
+        table_name='myblobs', column_name='blobs',
+        row_condition=('name', '==', 'bogus'),
+        parent=self._sqlite_blob_path_spec.parent)
+    self.assertFalse(file_system.FileEntryExistsByPathSpec(path_spec))
+
+    path_spec = sqlite_blob_path_spec.SQLiteBlobPathSpec(
+        table_name='myblobs', column_name='blobs',
+        row_condition=('name', 'LIKE', 'mmssms.db'),
+        parent=self._sqlite_blob_path_spec.parent)
+    self.assertFalse(file_system.FileEntryExistsByPathSpec(path_spec))
+
+    file_system.Close()
+
+    # The database is only opened on first use.
+    test_file = self._GetTestFilePath(['bogus.db'])
+    parent_path_spec = os_path_spec.OSPathSpec(location=test_file)
+    path_spec = sqlite_blob_path_spec.SQLiteBlobPathSpec(
+        table_name='myblobs', column_name='blobs', row_index=0,
+        parent=parent_path_spec)
+
+    file_system.Open(path_spec)
+
+    self.assertFalse(file_system.FileEntryExistsByPathSpec(path_spec))
+
+    file_system.Close()
+
+  def testFileEntryExistsByPathSpecWithCopy(self):
+    """Test the file entry exists functionality with a copied database."""
+    # A database that is not stored in an operating system file is copied
+    # through its file-like object.
+    test_file = self._GetTestFilePath(['blob.db'])
+    with open(test_file, 'rb') as file_object:
+      file_data = file_object.read()
+
+    # The fake file-like object is cached by the resolver context, which
+    # allows the SQLite blob file system to resolve it as its parent.
+    parent_path_spec = fake_path_spec.FakePathSpec(location='/blob.db')
+    parent_file_object = fake_file_io.FakeFile(
+        self._resolver_context, file_data)
+    parent_file_object.open(path_spec=parent_path_spec)
+
+    path_spec = sqlite_blob_path_spec.SQLiteBlobPathSpec(
+        table_name='myblobs', column_name='blobs',
+        row_condition=('name', '==', 'mmssms.db'), parent=parent_path_spec)
+
+    file_system = sqlite_blob_file_system.SQLiteBlobFileSystem(
+        self._resolver_context)
+    self.assertIsNotNone(file_system)
+
+    file_system.Open(path_spec)
+
+    self.assertTrue(file_system.FileEntryExistsByPathSpec(path_spec))
+
+    path_spec_bogus = sqlite_blob_path_spec.SQLiteBlobPathSpec(
+        table_name='myblobs', column_name='blobs',
+        row_condition=('name', '==', 'bogus'), parent=parent_path_spec)
+    self.assertFalse(file_system.FileEntryExistsByPathSpec(path_spec_bogus))
+
+    path_spec_row_index = sqlite_blob_path_spec.SQLiteBlobPathSpec(
+        table_name='myblobs', column_name='blobs', row_index=0,
+        parent=parent_path_spec)
+    self.assertTrue(file_system.FileEntryExistsByPathSpec(path_spec_row_index))
+
+    file_entry = file_system.GetFileEntryByPathSpec(path_spec)
+    self.assertIsNotNone(file_entry)
+    self.assertEqual(file_entry.size, 110592)
+
+    file_entry = file_system.GetFileEntryByPathSpec(path_spec_row_index)
+    self.assertIsNotNone(file_entry)
+    self.assertEqual(file_entry.size, 110592)
+
+    file_object = file_entry.GetFileObject()
+    self.assertEqual(file_object.get_size(), 110592)
+    file_object.close()
+
+    file_system.Close()
+
+    parent_file_object.close()
+
+  def testGetBlobSizeByPathSpec(self):
+    """Tests the GetBlobSizeByPathSpec function."""
+    file_system = sqlite_blob_file_system.SQLiteBlobFileSystem(
+        self._resolver_context)
+    self.assertIsNotNone(file_system)
+
+    file_system.Open(self._sqlite_blob_path_spec)
+
+    blob_size = file_system.GetBlobSizeByPathSpec(self._sqlite_blob_path_spec)
+    self.assertIsNone(blob_size)
+
+    blob_size = file_system.GetBlobSizeByPathSpec(
+        self._sqlite_blob_path_spec_2)
+    self.assertEqual(blob_size, 11)
+
     file_system.Close()
 
   def testGetFileEntryByPathSpec(self):
@@ -82,6 +189,22 @@ class SQLiteBlobFileSystemTest(shared_test_lib.BaseTestCase):
 
     file_system.Close()
 
+  def testGetNumberOfRows(self):
+    """Tests the GetNumberOfRows function."""
+    file_system = sqlite_blob_file_system.SQLiteBlobFileSystem(
+        self._resolver_context)
+    self.assertIsNotNone(file_system)
+
+    file_system.Open(self._sqlite_blob_path_spec)
+
+    number_of_rows = file_system.GetNumberOfRows('myblobs')
+    self.assertEqual(number_of_rows, 4)
+
+    with self.assertRaises(IOError):
+      file_system.GetNumberOfRows('bogus')
+
+    file_system.Close()
+
   def testGetRootFileEntry(self):
     """Test the get root file entry functionality."""
     file_system = sqlite_blob_file_system.SQLiteBlobFileSystem(